@@ -29,6 +29,11 @@ USAGE:
     Check idle status and cleanup for all configured apps:
         python app_launcher.py task-all
 
+    Both task commands accept --passes N (default: 3) to set the number of
+    overwrite passes; --passes 0 removes files without overwriting them.
+    --parallel N caps how many files are wiped at once (default: scaled to
+    the CPU count); --parallel 1 wipes one file at a time.
+
     Note: <app_name> must match a key under "apps" in config.json.
 
 CONFIGURATION:
@@ -39,6 +44,15 @@ CONFIGURATION:
     - max_days_idle: Positive integer - number of days idle before cleanup
     - cleanup_paths: List of file/directory paths to delete when idle threshold is met
 
+    Optional fields:
+    - mode: "overwrite" (default) overwrites files before deleting them;
+            "trim" skips the overwrite and just releases the data blocks
+            (truncate + delete), letting the filesystem TRIM them on SSDs
+    - wipe_passes: Non-negative integer - overwrite passes for this app's
+                   cleanup, overriding --passes; 0 behaves like "trim".
+                   It is applied as given, even on SSDs, where other
+                   cleanups are reduced to a single zero pass
+
     Example config.json:
     {
       "apps": {
@@ -77,6 +91,9 @@ DATABASE:
 SECURE DELETION:
     When cleanup is triggered, files and directories are securely deleted using:
     - Multiple overwrite passes (default: 3) with random data
+    - Paths on SSDs get a single zero-filled pass instead, since wear-leveling
+      defeats repeated overwrites
+    - --passes 0 skips overwriting (truncate + delete), e.g. for SSDs
     - Files are overwritten before deletion to prevent recovery
     - Symlinks are handled safely (link removed, not target)
     - Errors during deletion are logged but don't stop processing
@@ -95,20 +112,33 @@ CHANGE LOG:
                    improved error handling, and executable existence checks.
 """
 
-import argparse
+import atexit
 import datetime as dt
+import functools
 import json
 import logging
 import os
-import secrets
 import shlex
-import shutil
-import sqlite3
-import subprocess
+import stat
 import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Iterable
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Set, Tuple, Union, Iterable, Iterator
+
+# Heavier modules (sqlite3, shutil, subprocess, argparse, concurrent.futures)
+# are imported inside the functions that need them to keep CLI startup fast.
+if TYPE_CHECKING:
+    import argparse
+    import sqlite3
+    from concurrent.futures import Executor, Future
+    from typing import Deque
+
+# Optional faster JSON parser; stdlib json accepts the same bytes input.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # ---------------------------------------------------------------------------
 # GLOBAL SETUP
@@ -118,18 +148,30 @@ BASE_DIR = Path(__file__).resolve().parent
 CONFIG_PATH = BASE_DIR / "config.json"
 
 
+@functools.lru_cache(maxsize=1)
+def get_log_file_path() -> Path:
+    """
+    Get the path to the log file.
+    
+    Returns:
+        Path to the log file in the user's home directory (Windows)
+    """
+    home_dir = Path(os.environ.get("USERPROFILE", Path.home()))
+    return home_dir / "app_launcher.log"
+
+
 def setup_logging() -> None:
     """
-    Configure logging to both file and console.
+    Configure logging to file, and to the console when run from a terminal.
     
     Log file is created in the user's home directory:
     - Location: C:/Users/<username>/app_launcher.log
     
     Logs are rotated when they reach 10MB, keeping 5 backup files.
+    The console handler is only installed when stderr is an interactive
+    terminal; scheduled-task runs have no one reading it.
     """
-    # Get user home directory (Windows)
-    home_dir = Path(os.environ.get("USERPROFILE", Path.home()))
-    log_file = home_dir / "app_launcher.log"
+    log_file = get_log_file_path()
     
     # Create formatter
     formatter = logging.Formatter(
@@ -147,14 +189,6 @@ def setup_logging() -> None:
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
     
-    # Setup console handler (for when run from terminal)
-    console_handler = logging.StreamHandler(sys.stderr)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(logging.Formatter(
-        fmt="[%(levelname)s] %(message)s",
-        datefmt="%H:%M:%S"
-    ))
-    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
@@ -164,7 +198,17 @@ def setup_logging() -> None:
     
     # Add our handlers
     root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+
+    # Setup console handler (only when run from a terminal). sys.stderr is
+    # None under pythonw.exe.
+    if sys.stderr is not None and sys.stderr.isatty():
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(logging.Formatter(
+            fmt="[%(levelname)s] %(message)s",
+            datefmt="%H:%M:%S"
+        ))
+        root_logger.addHandler(console_handler)
     
     # Prevent duplicate logs from other libraries
     logging.getLogger("sqlite3").setLevel(logging.WARNING)
@@ -179,6 +223,10 @@ logger = logging.getLogger("AppLauncher")
 # CONFIGURATION
 # ---------------------------------------------------------------------------
 
+# Cleanup modes accepted in an app's "mode" field (first is the default)
+CLEANUP_MODES = ("overwrite", "trim")
+
+
 def validate_app_config(app_name: str, app_config: Dict[str, Any]) -> None:
     """
     Validate that an app configuration has all required fields and valid values.
@@ -229,27 +277,54 @@ def validate_app_config(app_name: str, app_config: Dict[str, Any]) -> None:
         if not all(isinstance(p, (str, Path)) for p in cleanup_paths):
             logger.error(f"App '{app_name}': All items in 'cleanup_paths' must be strings or Path objects.")
             sys.exit(1)
+    
+    # Validate 'mode' if present
+    if "mode" in app_config and app_config["mode"] not in CLEANUP_MODES:
+        logger.error(f"App '{app_name}': 'mode' must be one of {', '.join(CLEANUP_MODES)}, got: {app_config['mode']}")
+        sys.exit(1)
+    
+    # Validate 'wipe_passes' if present
+    if "wipe_passes" in app_config:
+        wipe_passes = app_config["wipe_passes"]
+        if not isinstance(wipe_passes, int) or isinstance(wipe_passes, bool) or wipe_passes < 0:
+            logger.error(f"App '{app_name}': 'wipe_passes' must be a non-negative integer, got: {wipe_passes}")
+            sys.exit(1)
 
 
-def load_config() -> Dict[str, Any]:
+# Parsed config cache: (mtime_ns, data, names of apps already validated).
+# Refreshed only when config.json changes on disk.
+_CONFIG_CACHE: Optional[Tuple[int, Dict[str, Any], Set[str]]] = None
+
+
+def _read_config() -> Tuple[Dict[str, Any], Set[str]]:
     """
-    Load and validate config.json.
+    Read and parse config.json, checking only its top-level structure.
+    
+    The parsed result is cached and reused until the file's modification
+    time changes, so repeated calls cost a single stat().
     
     Returns:
-        Dictionary containing the configuration with validated 'apps' key.
+        Tuple of the parsed configuration and the (mutable) set of app names
+        that have already passed validate_app_config() for this version.
         
     Raises:
         SystemExit: If config file is missing, invalid JSON, or missing 'apps' key.
     """
-    if not CONFIG_PATH.exists():
+    global _CONFIG_CACHE
+
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
         logger.error(f"Missing config file at {CONFIG_PATH}.")
         logger.error("Create config.json (see example in this repo).")
         sys.exit(1)
 
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == mtime:
+        return _CONFIG_CACHE[1], _CONFIG_CACHE[2]
+
     try:
-        text = CONFIG_PATH.read_text(encoding="utf-8")
-        data = json.loads(text)
-    except json.JSONDecodeError as e:
+        data = _json_loads(CONFIG_PATH.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         logger.error(f"Failed to parse config.json: {e}")
         sys.exit(1)
 
@@ -257,16 +332,37 @@ def load_config() -> Dict[str, Any]:
         logger.error("config.json must contain a JSON object with an 'apps' key.")
         sys.exit(1)
     
-    # Validate all app configurations
     apps = data.get("apps", {})
     if not isinstance(apps, dict):
         logger.error("'apps' in config.json must be a JSON object.")
         sys.exit(1)
     
+    logger.debug(f"Loaded configuration for {len(apps)} app(s).")
+    _CONFIG_CACHE = (mtime, data, set())
+    return data, _CONFIG_CACHE[2]
+
+
+def load_config() -> Dict[str, Any]:
+    """
+    Load config.json and validate every app configuration.
+    
+    Validation runs once per config version; later calls reuse the cached,
+    already-validated result.
+    
+    Returns:
+        Dictionary containing the configuration with validated 'apps' key.
+        
+    Raises:
+        SystemExit: If config file is missing, invalid, or an app config is invalid.
+    """
+    data, validated = _read_config()
+    apps = data["apps"]
+    
     for app_name, app_config in apps.items():
-        validate_app_config(app_name, app_config)
+        if app_name not in validated:
+            validate_app_config(app_name, app_config)
+            validated.add(app_name)
     
-    logger.debug(f"Loaded and validated configuration for {len(apps)} app(s).")
     return data
 
 
@@ -284,41 +380,31 @@ def _normalize_path(value: Union[str, Path]) -> Path:
     - Relative and absolute paths (Windows format)
     - Existing Path objects
     
-    We avoid strict resolve() so missing paths (to be deleted) don't error.
-    Preserves drive letters and UNC paths.
+    Normalization is pure string work (abspath/normpath) and never touches
+    the filesystem, so missing paths (to be deleted) don't error and
+    symlinks are not followed. Preserves drive letters and UNC paths.
     
     Args:
         value: String path or Path object to normalize
         
     Returns:
-        Normalized Path object (may not exist)
+        Normalized absolute Path object (may not exist)
         
     Raises:
         TypeError: If value is not str or Path
     """
     if isinstance(value, Path):
-        candidate = value
+        candidate = str(value)
     elif isinstance(value, str):
         # Expand environment variables (Windows format: %VAR%)
         expanded = os.path.expandvars(value)
         # Then expand user home directory
-        candidate = Path(expanded).expanduser()
+        candidate = os.path.expanduser(expanded)
     else:
         raise TypeError(f"Path value must be str or Path, got {type(value)}")
 
-    # Preserve absolute paths with drive letters
-    # resolve(strict=False) will normalize but won't fail if path doesn't exist
-    try:
-        resolved = candidate.resolve(strict=False)
-        # Ensure drive letter is preserved
-        if candidate.is_absolute() and not resolved.is_absolute() and candidate.drive:
-            # Fallback: use original if resolve lost the drive
-            return candidate
-        return resolved
-    except (RuntimeError, OSError):
-        # resolve can fail on deeply nested symlinks or invalid paths
-        # Return the expanded candidate as-is
-        return candidate
+    # abspath also normalizes separators and collapses "." / ".." segments
+    return Path(os.path.abspath(candidate))
 
 
 def _normalize_path_list(values: Iterable[Union[str, Path]]) -> List[Path]:
@@ -443,47 +529,58 @@ def _is_safe_path(path: Path) -> bool:
 # Database schema version
 DB_VERSION = 1
 
+# Resolved database path and shared connection, set up lazily on first use
+# and reused for the rest of the process.
+_DB_PATH: Optional[Path] = None
+_DB_CONN: "Optional[sqlite3.Connection]" = None
+
+
 def get_db_path() -> Path:
     """
     Return path to SQLite database.
     
     Database is stored in: %APPDATA%/.app_launch_tracker/state.db
+    The state directory is created on the first call only.
     
     Returns:
         Path to the database file
     """
-    base = Path(os.environ.get("APPDATA", Path.home()))
-    state_dir = base / ".app_launch_tracker"
-    state_dir.mkdir(parents=True, exist_ok=True)
-    return state_dir / "state.db"
+    global _DB_PATH
+    if _DB_PATH is None:
+        base = Path(os.environ.get("APPDATA", Path.home()))
+        state_dir = base / ".app_launch_tracker"
+        state_dir.mkdir(parents=True, exist_ok=True)
+        _DB_PATH = state_dir / "state.db"
+    return _DB_PATH
 
 
-def get_db_version(db_path: Path) -> int:
+def get_db_version(conn: "sqlite3.Connection") -> int:
     """
     Get the current database schema version.
     
     Args:
-        db_path: Path to the database file
+        conn: Open database connection
         
     Returns:
         Schema version number, or 0 if version table doesn't exist
     """
+    import sqlite3
+
     try:
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.execute("SELECT version FROM schema_version ORDER BY version DESC LIMIT 1")
-            row = cursor.fetchone()
-            return row[0] if row else 0
+        cursor = conn.execute("SELECT version FROM schema_version ORDER BY version DESC LIMIT 1")
+        row = cursor.fetchone()
+        return row[0] if row else 0
     except sqlite3.OperationalError:
         # Table doesn't exist yet
         return 0
 
 
-def migrate_db(db_path: Path, from_version: int, to_version: int) -> None:
+def migrate_db(conn: "sqlite3.Connection", from_version: int, to_version: int) -> None:
     """
     Migrate database schema from one version to another.
     
     Args:
-        db_path: Path to the database file
+        conn: Open database connection
         from_version: Current schema version
         to_version: Target schema version
     """
@@ -492,98 +589,202 @@ def migrate_db(db_path: Path, from_version: int, to_version: int) -> None:
     
     logger.info(f"Migrating database from version {from_version} to {to_version}")
     
-    with sqlite3.connect(db_path) as conn:
-        # Version 0 -> 1: Initial schema
-        if from_version < 1:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS launches (
-                    app_name TEXT PRIMARY KEY,
-                    last_launch_iso TEXT NOT NULL
-                )
-            """)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS schema_version (
-                    version INTEGER PRIMARY KEY,
-                    migrated_at TEXT NOT NULL
-                )
-            """)
-            now = dt.datetime.now(dt.timezone.utc).isoformat()
-            conn.execute("INSERT INTO schema_version (version, migrated_at) VALUES (?, ?)", (1, now))
-            conn.commit()
-            logger.info("Database migrated to version 1")
-        
-        # Future migrations would go here:
-        # if from_version < 2:
-        #     # Add new columns, tables, etc.
-        #     conn.execute("ALTER TABLE launches ADD COLUMN ...")
-        #     ...
-
-
-def init_db(db_path: Path) -> None:
+    # Version 0 -> 1: Initial schema, created and stamped in one batch
+    if from_version < 1:
+        conn.executescript("""
+            BEGIN;
+            CREATE TABLE IF NOT EXISTS launches (
+                app_name TEXT PRIMARY KEY,
+                last_launch_iso TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                migrated_at TEXT NOT NULL
+            );
+            INSERT INTO schema_version (version, migrated_at)
+                VALUES (1, strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'));
+            COMMIT;
+        """)
+        logger.info("Database migrated to version 1")
+    
+    # Future migrations would go here:
+    # if from_version < 2:
+    #     with conn:
+    #         # Add new columns, tables, etc.
+    #         conn.execute("ALTER TABLE launches ADD COLUMN ...")
+    #         ...
+
+
+def init_db(conn: "sqlite3.Connection") -> None:
     """
     Initialize the database schema if needed and run migrations.
     
+    The schema version is mirrored into SQLite's user_version header field,
+    so an up-to-date database is recognized without querying any table.
+    
     Args:
-        db_path: Path to the database file
+        conn: Open database connection
     """
-    current_version = get_db_version(db_path)
+    if conn.execute("PRAGMA user_version").fetchone()[0] == DB_VERSION:
+        return
+
+    current_version = get_db_version(conn)
     
     if current_version == 0:
         # First time setup
-        migrate_db(db_path, 0, DB_VERSION)
+        migrate_db(conn, 0, DB_VERSION)
     elif current_version < DB_VERSION:
         # Need to migrate
-        migrate_db(db_path, current_version, DB_VERSION)
+        migrate_db(conn, current_version, DB_VERSION)
     elif current_version > DB_VERSION:
         logger.warning(f"Database version ({current_version}) is newer than code version ({DB_VERSION}).")
         logger.warning("Some features may not work correctly. Please update the application.")
+        return
+
+    # PRAGMA values can't be bound as parameters
+    conn.execute(f"PRAGMA user_version = {DB_VERSION}")
+
+
+def _get_conn() -> "sqlite3.Connection":
+    """
+    Return the shared database connection.
+    
+    The connection is opened and the schema initialized on the first call;
+    later calls reuse it, so init_db runs exactly once per process.
+    
+    WAL journaling with synchronous=NORMAL keeps each single-row commit to
+    one WAL append instead of several fsyncs of the rollback journal. The
+    5s timeout is SQLite's busy_timeout for concurrent launches.
+    """
+    import sqlite3
+
+    global _DB_CONN
+    if _DB_CONN is None:
+        conn = sqlite3.connect(get_db_path(), timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        init_db(conn)
+        _DB_CONN = conn
+        # Closing checkpoints the WAL back into state.db on exit
+        atexit.register(conn.close)
+    return _DB_CONN
 
 
 def record_launch(app_name: str) -> None:
     """Update the last launch time for the app."""
-    db_path = get_db_path()
-    init_db(db_path)
+    record_launches([app_name])
+
+
+def record_launches(app_names: Iterable[str]) -> None:
+    """
+    Update the last launch time for several apps in a single transaction.
+    
+    SQLite's cost is dominated by commits rather than rows, so batch entry
+    points should record all their launches here in one call.
     
+    Args:
+        app_names: Names of the launched apps
+    """
+    import sqlite3
+
     now = dt.datetime.now(dt.timezone.utc).isoformat()
     try:
-        with sqlite3.connect(db_path) as conn:
-            conn.execute("""
+        conn = _get_conn()
+        with conn:
+            conn.executemany("""
                 INSERT INTO launches (app_name, last_launch_iso)
                 VALUES (?, ?)
                 ON CONFLICT(app_name) DO UPDATE SET last_launch_iso = excluded.last_launch_iso
-            """, (app_name, now))
-            conn.commit()
+            """, [(app_name, now) for app_name in app_names])
     except sqlite3.Error as e:
         logger.warning(f"Failed to record launch in DB: {e}")
 
 
 def get_last_launch(app_name: str) -> Optional[dt.datetime]:
     """Get the last launch time for the app."""
-    db_path = get_db_path()
-    init_db(db_path)
-    
+    import sqlite3
+
     try:
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.execute("SELECT last_launch_iso FROM launches WHERE app_name = ?", (app_name,))
-            row = cursor.fetchone()
-            if row:
-                return dt.datetime.fromisoformat(row[0])
+        conn = _get_conn()
+        cursor = conn.execute("SELECT last_launch_iso FROM launches WHERE app_name = ?", (app_name,))
+        row = cursor.fetchone()
+        if row:
+            return dt.datetime.fromisoformat(row[0])
     except (sqlite3.Error, ValueError) as e:
         logger.warning(f"Failed to read launch time: {e}")
     return None
 
 
+def get_last_launches(app_names: Iterable[str]) -> Dict[str, dt.datetime]:
+    """
+    Get the last launch times for several apps in one query.
+    
+    Args:
+        app_names: Names of the apps to look up
+        
+    Returns:
+        Dictionary mapping app name to last launch time. Apps with no
+        recorded launch (or an unreadable timestamp) are omitted.
+    """
+    import sqlite3
+
+    names = list(app_names)
+    launches: Dict[str, dt.datetime] = {}
+    try:
+        conn = _get_conn()
+        # Stay well below SQLite's host-parameter limit for very large configs
+        for start in range(0, len(names), 500):
+            batch = names[start:start + 500]
+            placeholders = ", ".join("?" * len(batch))
+            cursor = conn.execute(
+                f"SELECT app_name, last_launch_iso FROM launches WHERE app_name IN ({placeholders})",
+                batch,
+            )
+            for app_name, last_launch_iso in cursor:
+                try:
+                    launches[app_name] = dt.datetime.fromisoformat(last_launch_iso)
+                except ValueError as e:
+                    logger.warning(f"Failed to read launch time for '{app_name}': {e}")
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to read launch times: {e}")
+    return launches
+
+
 # ---------------------------------------------------------------------------
 # SECURE DELETE
 # ---------------------------------------------------------------------------
 
-def _make_writable(path: Path) -> None:
+# Upper bound on concurrent deletions in secure_delete_paths
+SECURE_DELETE_MAX_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+# Upper bound on concurrent file deletions inside directory trees. The work
+# is write-IOPS bound and SSDs serve many outstanding requests in parallel.
+SECURE_DELETE_FILE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Size of the buffer generated per overwrite pass, and so of each write()
+# call. 8 MiB already amortizes syscall overhead; larger buffers mostly
+# add memory, since up to SECURE_DELETE_FILE_WORKERS files hold one each.
+_WIPE_CHUNK = 8 * 1024 * 1024
+
+# fdatasync skips the inode metadata flush; not available on Windows
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# Raw write-only open for overwrites. O_SEQUENTIAL (FILE_FLAG_SEQUENTIAL_SCAN)
+# tells the Windows cache manager the file is streamed once front to back,
+# so it tears down cached views behind the write position instead of
+# keeping the soon-deleted data resident.
+_OVERWRITE_FLAGS = os.O_WRONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0)
+
+
+def _make_writable(path: Union[str, Path]) -> None:
     """
     Ensure file/dir is writable (Windows).
     
     On Windows, chmod has limited effect. This function attempts to make
     the file writable, but Windows permissions are primarily ACL-based.
     """
+    path = Path(path)
     try:
         if path.exists():
             # On Windows, chmod works but has limited effect
@@ -597,94 +798,437 @@ def _make_writable(path: Path) -> None:
         # This is acceptable - we'll handle permission errors during deletion
         pass
 
-def secure_delete_file(path: Path, passes: int = 3) -> None:
-    """Best-effort secure delete for a single file."""
+
+def _with_write_retry(func: Callable[[Any], Any], path: Union[str, Path]) -> Any:
+    """
+    Call func(path); on PermissionError make path writable and retry once.
+    
+    Cleanup targets are almost always already writable, so permissions are
+    only touched (stat + chmod) when the plain operation fails.
+    """
+    try:
+        return func(path)
+    except PermissionError:
+        _make_writable(path)
+        return func(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _drive_is_rotational(drive: str) -> Optional[bool]:
+    """
+    Report whether a drive (e.g. "C:") sits on rotational media.
+    
+    Asks the storage driver whether the volume incurs a seek penalty
+    (IOCTL_STORAGE_QUERY_PROPERTY / StorageDeviceSeekPenaltyProperty), which
+    is how Windows itself tells HDDs from SSDs. Cached per drive.
+    
+    Args:
+        drive: Drive letter with colon, as in Path.drive
+        
+    Returns:
+        True for HDDs, False for SSDs/flash, None if it can't be determined
+        (not Windows, no drive letter, or the query failed)
+    """
+    if os.name != "nt" or not drive or not drive.endswith(":"):
+        return None
+
+    import ctypes
+    from ctypes import wintypes
+
+    class STORAGE_PROPERTY_QUERY(ctypes.Structure):
+        _fields_ = [
+            ("PropertyId", wintypes.DWORD),
+            ("QueryType", wintypes.DWORD),
+            ("AdditionalParameters", wintypes.BYTE * 1),
+        ]
+
+    class DEVICE_SEEK_PENALTY_DESCRIPTOR(ctypes.Structure):
+        _fields_ = [
+            ("Version", wintypes.DWORD),
+            ("Size", wintypes.DWORD),
+            ("IncursSeekPenalty", wintypes.BOOLEAN),
+        ]
+
+    IOCTL_STORAGE_QUERY_PROPERTY = 0x002D1400
+    STORAGE_DEVICE_SEEK_PENALTY_PROPERTY = 7
+    PROPERTY_STANDARD_QUERY = 0
+    FILE_SHARE_READ_WRITE = 0x1 | 0x2
+    OPEN_EXISTING = 3
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    kernel32.CreateFileW.argtypes = [
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+    ]
+
+    # Access 0 is enough for property queries and needs no admin rights
+    handle = kernel32.CreateFileW(
+        f"\\\\.\\{drive}", 0, FILE_SHARE_READ_WRITE, None, OPEN_EXISTING, 0, None
+    )
+    if handle in (None, INVALID_HANDLE_VALUE):
+        return None
     try:
-        if not path.is_file():
+        query = STORAGE_PROPERTY_QUERY(STORAGE_DEVICE_SEEK_PENALTY_PROPERTY, PROPERTY_STANDARD_QUERY)
+        descriptor = DEVICE_SEEK_PENALTY_DESCRIPTOR()
+        returned = wintypes.DWORD()
+        ok = kernel32.DeviceIoControl(
+            wintypes.HANDLE(handle), IOCTL_STORAGE_QUERY_PROPERTY,
+            ctypes.byref(query), ctypes.sizeof(query),
+            ctypes.byref(descriptor), ctypes.sizeof(descriptor),
+            ctypes.byref(returned), None,
+        )
+        if not ok:
+            return None
+        return bool(descriptor.IncursSeekPenalty)
+    except (OSError, AttributeError):
+        return None
+    finally:
+        kernel32.CloseHandle(wintypes.HANDLE(handle))
+
+
+def _rmtree_retry(func: Callable[..., Any], path: str, exc: Any) -> None:
+    """
+    shutil.rmtree error hook: clear permissions and retry once, else log.
+    
+    Accepts both the onexc exception and the older onerror exc_info tuple.
+    """
+    if isinstance(exc, tuple):
+        exc = exc[1]
+    if isinstance(exc, FileNotFoundError):
+        return
+    if isinstance(exc, PermissionError) and func in (os.unlink, os.remove, os.rmdir):
+        try:
+            _make_writable(Path(path))
+            func(path)
             return
+        except OSError as e:
+            exc = e
+    logger.warning(f"Failed to remove {path}: {exc}")
+
+
+def secure_delete_file(
+    path: Union[str, Path],
+    passes: int = 3,
+    zero_fill: bool = False,
+    sync: bool = True,
+    length: Optional[int] = None,
+) -> None:
+    """
+    Best-effort secure delete for a single file.
+    
+    With passes=0 the file is truncated and removed without being
+    overwritten, which is much faster and is all that makes sense on SSDs,
+    where wear-leveling defeats overwrites anyway.
+    
+    Args:
+        path: File to delete
+        passes: Number of overwrite passes
+        zero_fill: Overwrite with zeros instead of random data (used for
+                   SSDs, where the pattern doesn't matter and zeros cost no
+                   entropy)
+        sync: Flush the overwrite to disk before unlinking. Without it the
+              passes may still be sitting in the OS cache when the file is
+              removed and never reach the device at all
+        length: File size, when the caller already has it from a stat() or
+                directory listing; saves stat'ing the file again
+    """
+    try:
+        if length is None:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                return
+            if not stat.S_ISREG(st.st_mode):
+                return
+            length = st.st_size
 
-        _make_writable(path)
-        length = path.stat().st_size
-
-        with path.open("r+b", buffering=0) as f:
-            for _ in range(passes):
-                f.seek(0)
-                # Overwrite with random bytes
-                remaining = length
-                chunk_size = 1024 * 1024
-                while remaining > 0:
-                    to_write = min(chunk_size, remaining)
-                    f.write(secrets.token_bytes(to_write))
-                    remaining -= to_write
-                f.flush()
-                # Force write to disk
-                os.fsync(f.fileno())
+        try:
+            fd = _with_write_retry(lambda p: os.open(p, _OVERWRITE_FLAGS), path)
+        except FileNotFoundError:
+            # Removed by something else since it was listed/stat'ed
+            return
+        try:
+            if passes <= 0:
+                # Fast mode: release the data blocks without overwriting them
+                os.ftruncate(fd, 0)
+            else:
+                pool_size = min(length, _WIPE_CHUNK)
+                write = os.write
+                for _ in range(passes):
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    # One buffer per pass (fresh random bytes, or zeros) written
+                    # repeatedly, instead of generating data per chunk
+                    if zero_fill:
+                        pool = memoryview(bytes(pool_size))
+                    else:
+                        pool = memoryview(os.urandom(pool_size))
+                    remaining = length
+                    while remaining > 0:
+                        remaining -= write(fd, pool[:remaining])
+                # Force the overwrite to disk once, after the last pass; the
+                # intermediate passes don't need to be durable on their own
+                if sync:
+                    _fdatasync(fd)
+        finally:
+            os.close(fd)
         
-        path.unlink()
+        _with_write_retry(os.unlink, path)
     except (OSError, PermissionError, IOError) as e:
         logger.warning(f"Failed secure delete of file {path}: {e}")
 
 
-def secure_delete_path(path: Union[str, Path], passes: int = 3) -> None:
-    """Recursively secure delete a file or directory."""
+def _scandir_tree(path: Union[str, Path]) -> Iterator[Tuple[os.DirEntry, bool]]:
+    """
+    Yield (entry, is_dir) for everything below path, children before parents.
+    
+    Uses the file type cached on each DirEntry from the directory listing, so
+    no extra stat() is issued per entry. Symlinks are reported as non-dirs and
+    never followed. Unreadable directories are logged and skipped, as with
+    os.walk.
+    
+    The walk is an explicit depth-first stack of open scandir iterators:
+    entries are streamed as they are read rather than collected into
+    per-directory lists, and deep trees can't hit the recursion limit.
+    """
+    try:
+        root_it = os.scandir(path)
+    except OSError as e:
+        logger.warning(f"Failed to list directory {path}: {e}")
+        return
+
+    # Each frame: (DirEntry of the directory or None for the root, its iterator)
+    stack: List[Tuple[Optional[os.DirEntry], Iterator[os.DirEntry]]] = [(None, root_it)]
+    try:
+        while stack:
+            dir_entry, it = stack[-1]
+            try:
+                entry = next(it, None)
+            except OSError as e:
+                logger.warning(f"Failed to list directory {dir_entry.path if dir_entry else path}: {e}")
+                entry = None
+
+            if entry is None:
+                # Directory exhausted; close it before the caller removes it
+                it.close()
+                stack.pop()
+                if dir_entry is not None:
+                    yield dir_entry, True
+            elif entry.is_dir(follow_symlinks=False):
+                try:
+                    stack.append((entry, os.scandir(entry.path)))
+                except OSError as e:
+                    logger.warning(f"Failed to list directory {entry.path}: {e}")
+                    yield entry, True
+            else:
+                yield entry, False
+    finally:
+        for _, it in stack:
+            it.close()
+
+
+def secure_delete_path(
+    path: Union[str, Path],
+    passes: int = 3,
+    zero_fill: bool = False,
+    executor: "Optional[Executor]" = None,
+    sync: bool = True,
+) -> None:
+    """
+    Recursively secure delete a file or directory.
+    
+    Files are wiped on executor when one is given: a single-file target
+    as one task, a directory's files concurrently (a private pool is
+    created for directories when none is given); directories are removed bottom-up
+    once all their files are gone. With passes=0 there is nothing to
+    overwrite, so directories are handed to shutil.rmtree instead.
+    """
     target = Path(path)
-    if not target.exists() and not target.is_symlink():
+    # One lstat covers the existence, symlink and file-type checks
+    try:
+        st = os.lstat(target)
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        logger.warning(f"Failed to stat {target}: {e}")
         return
 
     # Handle symlinks (delete link, not target)
-    if target.is_symlink():
+    if stat.S_ISLNK(st.st_mode):
         try:
             target.unlink()
         except (OSError, PermissionError) as e:
             logger.warning(f"Failed to remove symlink {target}: {e}")
         return
 
-    if target.is_file():
-        secure_delete_file(target, passes=passes)
+    if stat.S_ISREG(st.st_mode):
+        if executor is None:
+            secure_delete_file(target, passes=passes, zero_fill=zero_fill, sync=sync, length=st.st_size)
+        else:
+            # Wipe on the file pool too, so its size alone bounds how many
+            # files are overwritten at once
+            executor.submit(secure_delete_file, target, passes, zero_fill, sync, st.st_size).result()
         return
 
-    # Directory: recursive delete
-    # We walk using rglob('*') but that won't give us the order strictly bottom-up for dirs easily
-    # So we use os.walk (or manual) to ensure we delete children before parents.
-    # Actually, shutil.rmtree has no secure overwrite.
-    # We'll stick to os.walk logic but with path objects for cleaner code.
-    
-    for root, dirs, files in os.walk(target, topdown=False):
-        root_path = Path(root)
-        for name in files:
-            fpath = root_path / name
-            if fpath.is_symlink():
-                fpath.unlink(missing_ok=True)
-            else:
-                secure_delete_file(fpath, passes=passes)
-        
-        for name in dirs:
-            dpath = root_path / name
-            if dpath.is_symlink():
-                dpath.unlink(missing_ok=True)
+    if not stat.S_ISDIR(st.st_mode):
+        return
+
+    if passes <= 0:
+        import shutil
+
+        # rmtree's C-level scandir/unlink loop beats walking in Python
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(target, onexc=_rmtree_retry)
+        else:
+            shutil.rmtree(target, onerror=_rmtree_retry)
+        return
+
+    if executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=SECURE_DELETE_FILE_WORKERS) as own_executor:
+            secure_delete_path(
+                target, passes=passes, zero_fill=zero_fill, executor=own_executor, sync=sync
+            )
+        return
+
+    # Directory: delete files concurrently, keeping a bounded number in
+    # flight so huge trees don't queue every file up front
+    from collections import deque
+
+    pending: "Deque[Future]" = deque()
+    max_pending = SECURE_DELETE_FILE_WORKERS * 4
+    # Plain string paths: no Path object is built per entry in the loop
+    dirs: List[str] = []
+    # Bound once: this loop runs per entry over potentially huge trees
+    submit = executor.submit
+    add_pending = pending.append
+    add_dir = dirs.append
+    for entry, is_dir in _scandir_tree(target):
+        if is_dir:
+            add_dir(entry.path)
+        elif entry.is_symlink():
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+        else:
+            # The listing already carries the type and size on Windows, so
+            # this is usually free; otherwise let the worker stat the file
+            try:
+                entry_st = entry.stat(follow_symlinks=False)
+            except OSError:
+                length = None
             else:
-                _make_writable(dpath)
-                try:
-                    dpath.rmdir()
-                except OSError as e:
-                    logger.warning(f"Failed to remove dir {dpath}: {e}")
+                # Only regular files are overwritten; opening a FIFO or
+                # device node for writing could block or hit hardware
+                if not stat.S_ISREG(entry_st.st_mode):
+                    continue
+                length = entry_st.st_size
+            add_pending(submit(secure_delete_file, entry.path, passes, zero_fill, sync, length))
+            if len(pending) >= max_pending:
+                pending.popleft().result()
+    for future in pending:
+        future.result()
+
+    # Children before parents (_scandir_tree yields dirs bottom-up)
+    for dpath in dirs:
+        try:
+            _with_write_retry(os.rmdir, dpath)
+        except OSError as e:
+            logger.warning(f"Failed to remove dir {dpath}: {e}")
 
     # Finally remove top directory
-    _make_writable(target)
     try:
-        target.rmdir()
+        _with_write_retry(os.rmdir, target)
     except OSError as e:
         logger.warning(f"Failed to remove directory {target}: {e}")
 
 
-def secure_delete_paths(paths: Iterable[Union[str, Path]], passes: int = 3) -> None:
+def _secure_delete_target(
+    path_obj: Path,
+    passes: int,
+    executor: "Executor",
+    sync: bool = True,
+    exact_passes: bool = False,
+) -> None:
+    """
+    Securely delete one validated cleanup path, logging (not raising) errors.
+    
+    On SSDs, where wear-leveling makes repeated overwrites pointless, the
+    work is reduced to at most one zero-filled pass, unless exact_passes
+    says the pass count was chosen explicitly for this path.
+    """
+    zero_fill = False
+    if not exact_passes and passes > 0 and _drive_is_rotational(path_obj.drive) is False:
+        logger.info(f"{path_obj.drive} is a solid-state drive; using a single zero pass.")
+        passes = 1
+        zero_fill = True
+
+    logger.info(f"Securely deleting: {path_obj}")
+    try:
+        secure_delete_path(
+            path_obj, passes=passes, zero_fill=zero_fill, executor=executor, sync=sync
+        )
+    except Exception as e:
+        logger.error(f"Failed to delete {path_obj}: {e}")
+
+
+def _drop_nested_targets(targets: List[Path]) -> List[Path]:
+    """
+    Remove duplicate targets and targets inside another target.
+    
+    Targets are deleted concurrently, so a path listed twice (or a folder
+    listed alongside its parent) would otherwise be walked by two threads
+    racing to overwrite and unlink the same files. Deleting the outermost
+    path covers everything below it. Order of the remaining targets is kept.
+    """
+    # normcase folds case and separators the way the filesystem compares them
+    keys = {id(t): os.path.normcase(str(t)).rstrip("\\/") for t in targets}
+    kept: List[Path] = []
+    kept_keys: List[str] = []
+    # Shorter paths first, so a parent is always seen before its children
+    for target in sorted(targets, key=lambda t: len(keys[id(t)])):
+        key = keys[id(target)]
+        if any(key == k or key.startswith(k + os.sep) for k in kept_keys):
+            logger.info(f"Skipping {target}: already covered by another cleanup path.")
+            continue
+        kept.append(target)
+        kept_keys.append(key)
+    kept_ids = {id(t) for t in kept}
+    return [t for t in targets if id(t) in kept_ids]
+
+
+def secure_delete_paths(
+    paths: Iterable[Union[str, Path]],
+    passes: int = 3,
+    sync: bool = True,
+    parallel: Optional[int] = None,
+    exact_passes: bool = False,
+) -> None:
     """
     Securely delete multiple paths with safety validation.
     
+    Paths are validated and de-duplicated up front (nested paths are left to
+    their parent), then deleted concurrently. The work is
+    dominated by write/fsync calls, which release the GIL, so overlapping
+    them across paths hides per-file flush latency.
+    
     Args:
         paths: Iterable of paths (strings or Path objects) to delete
-        passes: Number of overwrite passes for secure deletion (default: 3)
+        passes: Number of overwrite passes for secure deletion (default: 3);
+                0 truncates and removes files without overwriting them
+        sync: Flush each overwritten file to disk before unlinking it
+              (default: True). Disabling it is faster but leaves no
+              guarantee the overwrite ever reached the device
+        parallel: Maximum number of files wiped at once, and of paths
+                  processed at once (default: SECURE_DELETE_FILE_WORKERS
+                  files and SECURE_DELETE_MAX_WORKERS paths)
+        exact_passes: Use passes as given even on SSDs, instead of reducing
+                      it to a single zero-filled pass
     """
+    targets = []
     for p in paths:
         path_obj = _normalize_path(p)
         
@@ -694,12 +1238,27 @@ def secure_delete_paths(paths: Iterable[Union[str, Path]], passes: int = 3) -> N
             logger.error("This path appears to be a critical system directory.")
             continue
         
-        logger.info(f"Securely deleting: {path_obj}")
-        try:
-            secure_delete_path(path_obj, passes=passes)
-        except Exception as e:
-            logger.error(f"Failed to delete {path_obj}: {e}")
-            # Continue with next path
+        targets.append(path_obj)
+
+    targets = _drop_nested_targets(targets)
+    if not targets:
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Top-level paths run on one pool; every file wipe, whether a file
+    # target itself or a file inside a directory, runs on a shared second
+    # pool, so the number of files wiped at once never exceeds its size
+    if parallel is None:
+        workers = min(len(targets), SECURE_DELETE_MAX_WORKERS)
+        file_workers = SECURE_DELETE_FILE_WORKERS
+    else:
+        workers = min(len(targets), parallel)
+        file_workers = parallel
+    with ThreadPoolExecutor(max_workers=file_workers) as file_executor:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Errors are handled per path in _secure_delete_target
+            list(executor.map(lambda t: _secure_delete_target(t, passes, file_executor, sync, exact_passes), targets))
 
 
 # ---------------------------------------------------------------------------
@@ -717,31 +1276,108 @@ def get_app_config(app_name: str) -> Dict[str, Any]:
         Dictionary containing the app's configuration
         
     Raises:
-        SystemExit: If app is not found in configuration
+        SystemExit: If app is not found in configuration or is invalid
+    """
+    # Only the requested app is validated; other entries aren't needed here
+    config, validated = _read_config()
+    app = config["apps"].get(app_name)
+    if not app:
+        logger.error(f"Unknown app '{app_name}'. Configure it in config.json.")
+        sys.exit(1)
+    if app_name not in validated:
+        validate_app_config(app_name, app)
+        validated.add(app_name)
+    return app
+
+
+@functools.lru_cache(maxsize=256)
+def _which_cached(exe: str) -> Optional[str]:
+    """
+    Cached shutil.which().
+    
+    On Windows each lookup tries every PATHEXT extension in every PATH entry,
+    so repeated lookups of the same executable (task-all) are worth caching.
+    """
+    import shutil
+
+    return shutil.which(exe)
+
+
+# config.json size above which single-app lookups stream-parse (with the
+# optional ijson package) instead of loading the whole file. Below this a
+# full json parse is faster than even ijson's C backend.
+STREAM_CONFIG_MIN_BYTES = 1024 * 1024
+
+
+def get_app_config_streaming(app_name: str) -> Dict[str, Any]:
+    """
+    Get configuration for a single app, parsing only as much of config.json
+    as needed to find it.
+    
+    Uses ijson, when installed, to pull out just the "apps.<app_name>" subtree
+    of a large config file and validates only that entry. Falls back to
+    get_app_config() when ijson isn't available, the file is small, or the
+    app name contains "." (ijson's prefix separator).
+    
+    Args:
+        app_name: Name of the app as defined in config.json
+        
+    Returns:
+        Dictionary containing the app's configuration
+        
+    Raises:
+        SystemExit: If config file is missing or invalid, or the app is not found
     """
-    config = load_config()
-    app = config.get("apps", {}).get(app_name)
+    try:
+        import ijson
+    except ImportError:
+        return get_app_config(app_name)
+
+    try:
+        size = CONFIG_PATH.stat().st_size
+    except FileNotFoundError:
+        size = 0  # get_app_config reports the missing file
+    if size < STREAM_CONFIG_MIN_BYTES or "." in app_name:
+        return get_app_config(app_name)
+
+    try:
+        with CONFIG_PATH.open("rb") as f:
+            app = next(ijson.items(f, f"apps.{app_name}"), None)
+    except ijson.JSONError as e:
+        logger.error(f"Failed to parse config.json: {e}")
+        sys.exit(1)
+
     if not app:
         logger.error(f"Unknown app '{app_name}'. Configure it in config.json.")
         sys.exit(1)
+    validate_app_config(app_name, app)
     return app
 
 
+@functools.lru_cache(maxsize=64)
+def _split_cmd(cmd_line: str) -> Tuple[str, ...]:
+    """Split a string command line (cached; the same cmd is split on every task run)."""
+    # Use posix=False for Windows shell command parsing
+    return tuple(shlex.split(cmd_line, posix=False))
+
+
 def _normalize_cmd(cmd_value: Any) -> List[str]:
     """
     Ensure cmd is a list of strings.
     
+    A fresh list is returned every time, so callers may modify it without
+    touching the cached config or split results.
+    
     Note: Command values are executed via subprocess.Popen. Since config.json
     is a trusted local file, command injection risk is minimal. However, users
     should only modify config.json with trusted applications.
     """
     if isinstance(cmd_value, list) and all(isinstance(part, str) for part in cmd_value):
-        return cmd_value
+        return list(cmd_value)
     if isinstance(cmd_value, str):
-        # Use posix=False for Windows shell command parsing
-        split_cmd = shlex.split(cmd_value, posix=False)
+        split_cmd = _split_cmd(cmd_value)
         if split_cmd:
-            return split_cmd
+            return list(split_cmd)
     logger.error("'cmd' must be a non-empty list of strings or a string command line.")
     sys.exit(1)
 
@@ -759,7 +1395,9 @@ def handle_launch(app_name: str) -> None:
     Raises:
         SystemExit: If app config is invalid or launch fails
     """
-    app = get_app_config(app_name)
+    import subprocess
+
+    app = get_app_config_streaming(app_name)
     raw_cmd = app.get("cmd")
     if not raw_cmd:
         logger.error(f"No 'cmd' configured for app '{app_name}'.")
@@ -769,7 +1407,7 @@ def handle_launch(app_name: str) -> None:
     
     # Resolve first argument (executable)
     exe = cmd[0]
-    resolved_exe = shutil.which(exe) or (exe if Path(exe).exists() else None)
+    resolved_exe = _which_cached(exe) or (exe if Path(exe).exists() else None)
     
     if not resolved_exe:
         logger.error(f"Executable not found for '{app_name}': {exe}")
@@ -793,7 +1431,13 @@ def handle_launch(app_name: str) -> None:
     logger.info(f"Recorded launch time for '{app_name}'.")
 
 
-def handle_task(app_name: str) -> None:
+def handle_task(
+    app_name: str,
+    app_config: Optional[Dict[str, Any]] = None,
+    launches: Optional[Dict[str, dt.datetime]] = None,
+    passes: int = 3,
+    parallel: Optional[int] = None,
+) -> None:
     """
     Check if an app has been idle too long and perform cleanup if needed.
     
@@ -803,35 +1447,28 @@ def handle_task(app_name: str) -> None:
     
     Args:
         app_name: Name of the app to check (must exist in config.json)
+        app_config: Already-loaded configuration for the app. When omitted,
+                    it is looked up via get_app_config_streaming().
+        launches: Last launch times pre-fetched with get_last_launches().
+                  When omitted, the database is queried for this app.
+        passes: Number of overwrite passes used for cleanup (0 = no overwrite);
+                the app's own 'wipe_passes' setting takes precedence
+        parallel: Maximum number of concurrent deletions (see secure_delete_paths)
     """
     try:
-        try:
-            app = get_app_config(app_name)
-        except SystemExit:
-            # get_app_config calls sys.exit() if app not found, but we want to continue
-            # with other apps when called from handle_task_all()
-            logger.error(f"App '{app_name}' not found in configuration. Skipping task.")
-            return
-        
-        # Check if executable exists (app may have been uninstalled)
-        raw_cmd = app.get("cmd")
-        if raw_cmd:
+        if app_config is not None:
+            app = app_config
+        else:
             try:
-                cmd = _normalize_cmd(raw_cmd)
+                app = get_app_config_streaming(app_name)
             except SystemExit:
-                # _normalize_cmd calls sys.exit() on invalid input, but we want to continue
+                # get_app_config calls sys.exit() if app not found, but we want to continue
                 # with other apps when called from handle_task_all()
-                logger.error(f"Invalid 'cmd' configuration for '{app_name}'. Skipping task.")
-                return
-            exe = cmd[0]
-            resolved_exe = shutil.which(exe) or (exe if Path(exe).exists() else None)
-            
-            if not resolved_exe:
-                logger.warning(f"Executable not found for '{app_name}': {exe}")
-                logger.warning(f"App may have been uninstalled. Skipping task for '{app_name}'.")
-                logger.warning("Consider removing this app from config.json or reinstalling the application.")
+                logger.error(f"App '{app_name}' not found in configuration. Skipping task.")
                 return
         
+        # Settle the cheap config checks first, so apps with nothing to clean
+        # up skip the executable lookup and the database query entirely
         max_days = app.get("max_days_idle")
         cleanup_paths_raw = app.get("cleanup_paths", [])
 
@@ -840,8 +1477,6 @@ def handle_task(app_name: str) -> None:
             logger.error(f"Skipping task for '{app_name}' due to configuration error.")
             return
 
-        cleanup_paths = _normalize_path_list(cleanup_paths_raw)
-
         if max_days is None:
             logger.warning(f"No 'max_days_idle' configured for '{app_name}'. Nothing to do.")
             return
@@ -852,7 +1487,33 @@ def handle_task(app_name: str) -> None:
             logger.error(f"Skipping task for '{app_name}' due to configuration error.")
             return
 
-        last_launch = get_last_launch(app_name)
+        if not cleanup_paths_raw:
+            logger.info(f"No cleanup paths configured for '{app_name}'. Nothing to do.")
+            return
+
+        # Check if executable exists (app may have been uninstalled)
+        raw_cmd = app.get("cmd")
+        if raw_cmd:
+            try:
+                cmd = _normalize_cmd(raw_cmd)
+            except SystemExit:
+                # _normalize_cmd calls sys.exit() on invalid input, but we want to continue
+                # with other apps when called from handle_task_all()
+                logger.error(f"Invalid 'cmd' configuration for '{app_name}'. Skipping task.")
+                return
+            exe = cmd[0]
+            resolved_exe = _which_cached(exe) or (exe if Path(exe).exists() else None)
+            
+            if not resolved_exe:
+                logger.warning(f"Executable not found for '{app_name}': {exe}")
+                logger.warning(f"App may have been uninstalled. Skipping task for '{app_name}'.")
+                logger.warning("Consider removing this app from config.json or reinstalling the application.")
+                return
+        
+        if launches is not None:
+            last_launch = launches.get(app_name)
+        else:
+            last_launch = get_last_launch(app_name)
         now = dt.datetime.now(dt.timezone.utc)
 
         if last_launch is None:
@@ -875,12 +1536,22 @@ def handle_task(app_name: str) -> None:
             logger.info(f"App '{app_name}' last launch: {last_launch.isoformat()} ({idle_days} days ago)")
 
         if idle_days is not None and idle_days > max_days:
-            if not cleanup_paths:
-                logger.info(f"No cleanup paths configured for '{app_name}'. Skipping deletion.")
-                return
             logger.info(f"Idle threshold exceeded (>{max_days} days). Proceeding to secure delete.")
+            # An app's own wipe_passes is used as-is, even on SSDs
+            exact_passes = False
+            if app.get("mode") == "trim":
+                # Release the data without overwriting it
+                passes = 0
+            elif "wipe_passes" in app:
+                passes = app["wipe_passes"]
+                exact_passes = True
             try:
-                secure_delete_paths(cleanup_paths, passes=3)
+                secure_delete_paths(
+                    _normalize_path_list(cleanup_paths_raw),
+                    passes=passes,
+                    parallel=parallel,
+                    exact_passes=exact_passes,
+                )
             except Exception as e:
                 logger.error(f"Error during secure delete for '{app_name}': {e}")
                 logger.exception("Full traceback:")
@@ -893,13 +1564,17 @@ def handle_task(app_name: str) -> None:
         return  # Don't crash, continue with other apps if task-all
 
 
-def handle_task_all() -> None:
+def handle_task_all(passes: int = 3, parallel: Optional[int] = None) -> None:
     """
     Run task for every configured app in config.json.
     
     Iterates through all apps defined in the configuration and runs
     handle_task() for each one to check idle status and perform cleanup.
     If one app fails, processing continues with the remaining apps.
+    
+    Args:
+        passes: Number of overwrite passes used for cleanup (0 = no overwrite)
+        parallel: Maximum number of concurrent deletions (see secure_delete_paths)
     """
     try:
         config = load_config()
@@ -909,10 +1584,11 @@ def handle_task_all() -> None:
             return
         
         logger.info(f"Processing {len(apps)} app(s)...")
-        for app_name in apps:
+        launches = get_last_launches(apps)
+        for app_name, app_config in apps.items():
             logger.info(f"Running task for '{app_name}'")
             try:
-                handle_task(app_name)
+                handle_task(app_name, app_config, launches, passes=passes, parallel=parallel)
             except Exception as e:
                 logger.error(f"Failed to process '{app_name}': {e}")
                 logger.exception("Full traceback:")
@@ -930,27 +1606,18 @@ def handle_task_all() -> None:
 # CLI
 # ---------------------------------------------------------------------------
 
-def get_log_file_path() -> Path:
+def parse_args(argv: Optional[List[str]] = None) -> "argparse.Namespace":
     """
-    Get the path to the log file.
+    Parse command-line arguments.
     
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+        
     Returns:
-        Path to the log file in the user's home directory (Windows)
+        Parsed arguments namespace
     """
-    home_dir = Path(os.environ.get("USERPROFILE", Path.home()))
-    return home_dir / "app_launcher.log"
+    import argparse
 
-
-def main() -> None:
-    """
-    Main entry point for the application launcher CLI.
-    
-    Parses command-line arguments and dispatches to the appropriate handler.
-    """
-    # Log startup information
-    log_file = get_log_file_path()
-    logger.info(f"App Launcher started - Log file: {log_file}")
-    
     parser = argparse.ArgumentParser(
         description="Launch apps and clean up their data if not used for N days."
     )
@@ -962,17 +1629,41 @@ def main() -> None:
     p_task = subparsers.add_parser("task", help="Check idle time and cleanup if needed.")
     p_task.add_argument("app_name", help="Name of the app as defined in config.json.")
 
-    subparsers.add_parser("task-all", help="Check all apps.")
+    p_task_all = subparsers.add_parser("task-all", help="Check all apps.")
 
-    args = parser.parse_args()
+    passes_help = "Overwrite passes for secure delete (default: 3). Use 0 for SSDs to skip overwriting."
+    parallel_help = "Maximum number of files wiped at once (default: based on CPU count)."
+    for p in (p_task, p_task_all):
+        p.add_argument("--passes", type=int, default=3, help=passes_help)
+        p.add_argument("--parallel", type=int, default=None, metavar="N", help=parallel_help)
+
+    args = parser.parse_args(argv)
+    if getattr(args, "passes", 0) < 0:
+        parser.error("--passes must be 0 or greater.")
+    if getattr(args, "parallel", None) is not None and args.parallel < 1:
+        parser.error("--parallel must be 1 or greater.")
+    return args
+
+
+def main() -> None:
+    """
+    Main entry point for the application launcher CLI.
+    
+    Parses command-line arguments and dispatches to the appropriate handler.
+    """
+    # Log startup information
+    log_file = get_log_file_path()
+    logger.info(f"App Launcher started - Log file: {log_file}")
+    
+    args = parse_args()
 
     try:
         if args.command == "launch":
             handle_launch(args.app_name)
         elif args.command == "task":
-            handle_task(args.app_name)
+            handle_task(args.app_name, passes=args.passes, parallel=args.parallel)
         elif args.command == "task-all":
-            handle_task_all()
+            handle_task_all(passes=args.passes, parallel=args.parallel)
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
         sys.exit(130)
@@ -5,12 +5,13 @@ Performs a software inventory of traditionally installed applications on Windows
 excluding pre-requisites like .NET, C++ runtimes, etc.
 """
 
+import re
 import sys
 import platform
 import winreg
 import json
 import csv
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import XMLGenerator
 from datetime import datetime
 from typing import List, Dict, Optional
 
@@ -35,6 +36,17 @@ EXCLUDE_KEYWORDS = [
     'prereq',
 ]
 
+# All keywords as one alternation, so each name is scanned once in C
+_EXCLUDE_RE = re.compile('|'.join(re.escape(k) for k in EXCLUDE_KEYWORDS))
+
+# (element name, software dict key) for each <Application> child in XML exports
+XML_FIELDS = [
+    ('Name', 'name'),
+    ('Version', 'version'),
+    ('Publisher', 'publisher'),
+    ('InstallDate', 'install_date'),
+]
+
 
 def check_windows_os() -> bool:
     """Check if the operating system is Windows."""
@@ -60,57 +72,48 @@ def get_installed_software() -> List[Dict[str, str]]:
     
     for hkey, path in registry_paths:
         try:
-            key = winreg.OpenKey(hkey, path)
-            i = 0
-            while True:
-                try:
-                    subkey_name = winreg.EnumKey(key, i)
-                    subkey = winreg.OpenKey(key, subkey_name)
-                    
+            with winreg.OpenKey(hkey, path) as key:
+                # Subkey count up front, instead of probing EnumKey until it fails
+                subkey_count = winreg.QueryInfoKey(key)[0]
+                for i in range(subkey_count):
                     try:
-                        display_name = winreg.QueryValueEx(subkey, "DisplayName")[0]
-                        display_version = winreg.QueryValueEx(subkey, "DisplayVersion")[0] if winreg.QueryValueEx(subkey, "DisplayVersion")[0] else "N/A"
-                    except (FileNotFoundError, OSError):
-                        i += 1
+                        subkey_name = winreg.EnumKey(key, i)
+                        with winreg.OpenKey(key, subkey_name) as subkey:
+                            try:
+                                display_name = winreg.QueryValueEx(subkey, "DisplayName")[0]
+                                display_version = winreg.QueryValueEx(subkey, "DisplayVersion")[0] or "N/A"
+                            except (FileNotFoundError, OSError):
+                                continue
+                            
+                            # Skip if already seen or if it's a pre-requisite
+                            display_name_lower = display_name.lower()
+                            if display_name_lower in seen_names:
+                                continue
+                            
+                            # Check if it should be excluded
+                            if _EXCLUDE_RE.search(display_name_lower):
+                                continue
+                            
+                            try:
+                                publisher = winreg.QueryValueEx(subkey, "Publisher")[0]
+                            except (FileNotFoundError, OSError):
+                                publisher = "N/A"
+                            
+                            try:
+                                install_date = winreg.QueryValueEx(subkey, "InstallDate")[0]
+                            except (FileNotFoundError, OSError):
+                                install_date = "N/A"
+                            
+                            software_list.append({
+                                'name': display_name,
+                                'version': display_version,
+                                'publisher': publisher,
+                                'install_date': install_date
+                            })
+                            seen_names.add(display_name_lower)
+                    except OSError:
+                        # Subkey vanished or can't be opened; keep going
                         continue
-                    
-                    # Skip if already seen or if it's a pre-requisite
-                    if display_name.lower() in seen_names:
-                        i += 1
-                        continue
-                    
-                    # Check if it should be excluded
-                    should_exclude = False
-                    display_name_lower = display_name.lower()
-                    for keyword in EXCLUDE_KEYWORDS:
-                        if keyword in display_name_lower:
-                            should_exclude = True
-                            break
-                    
-                    if not should_exclude:
-                        try:
-                            publisher = winreg.QueryValueEx(subkey, "Publisher")[0]
-                        except (FileNotFoundError, OSError):
-                            publisher = "N/A"
-                        
-                        try:
-                            install_date = winreg.QueryValueEx(subkey, "InstallDate")[0]
-                        except (FileNotFoundError, OSError):
-                            install_date = "N/A"
-                        
-                        software_list.append({
-                            'name': display_name,
-                            'version': display_version,
-                            'publisher': publisher,
-                            'install_date': install_date
-                        })
-                        seen_names.add(display_name_lower)
-                    
-                    winreg.CloseKey(subkey)
-                    i += 1
-                except OSError:
-                    break
-            winreg.CloseKey(key)
         except (FileNotFoundError, OSError):
             continue
     
@@ -156,12 +159,15 @@ def export_to_text(software_list: List[Dict[str, str]], filename: str) -> None:
         f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         f.write("=" * 80 + "\n\n")
         
-        for software in software_list:
-            f.write(f"Name: {software['name']}\n")
-            f.write(f"  Version: {software['version']}\n")
-            f.write(f"  Publisher: {software['publisher']}\n")
-            f.write(f"  Install Date: {software['install_date']}\n")
-            f.write("-" * 80 + "\n")
+        separator = "-" * 80 + "\n"
+        f.writelines(
+            f"Name: {software['name']}\n"
+            f"  Version: {software['version']}\n"
+            f"  Publisher: {software['publisher']}\n"
+            f"  Install Date: {software['install_date']}\n"
+            + separator
+            for software in software_list
+        )
         
         f.write(f"\nTotal Applications: {len(software_list)}\n")
     print(f"Software inventory exported to {filename}")
@@ -180,21 +186,31 @@ def export_to_json(software_list: List[Dict[str, str]], filename: str) -> None:
 
 
 def export_to_xml(software_list: List[Dict[str, str]], filename: str) -> None:
-    """Export software list to XML format."""
-    root = ET.Element('SoftwareInventory')
-    root.set('generated', datetime.now().isoformat())
-    root.set('total_count', str(len(software_list)))
-    
-    for software in software_list:
-        app = ET.SubElement(root, 'Application')
-        ET.SubElement(app, 'Name').text = software['name']
-        ET.SubElement(app, 'Version').text = software['version']
-        ET.SubElement(app, 'Publisher').text = software['publisher']
-        ET.SubElement(app, 'InstallDate').text = software['install_date']
-    
-    tree = ET.ElementTree(root)
-    ET.indent(tree, space="  ")
-    tree.write(filename, encoding='utf-8', xml_declaration=True)
+    """Export software list to XML format, writing one application at a time."""
+    # newline='' keeps the LF line endings ET.write produced, also on Windows
+    with open(filename, 'w', encoding='utf-8', newline='') as f:
+        xml = XMLGenerator(f, encoding='utf-8', short_empty_elements=True)
+        xml.startDocument()
+        xml.startElement('SoftwareInventory', {
+            'generated': datetime.now().isoformat(),
+            'total_count': str(len(software_list))
+        })
+        
+        for software in software_list:
+            xml.ignorableWhitespace("\n  ")
+            xml.startElement('Application', {})
+            for tag, field in XML_FIELDS:
+                xml.ignorableWhitespace("\n    ")
+                xml.startElement(tag, {})
+                xml.characters(str(software[field]))
+                xml.endElement(tag)
+            xml.ignorableWhitespace("\n  ")
+            xml.endElement('Application')
+        
+        if software_list:
+            xml.ignorableWhitespace("\n")
+        xml.endElement('SoftwareInventory')
+        xml.endDocument()
     print(f"Software inventory exported to {filename}")
 
 